@@ -12,7 +12,7 @@ Qt dialog (requires ``pip install pyqt-app-info[qt]``)::
 """
 
 from .info import AppIdentity, AppInfo, ExecutionInfo, gather_info
-from .tools import ToolRegistry, ToolResult, ToolSpec
+from .tools import ToolRegistry, ToolResult, ToolSpec, default_cache_path
 
 __all__ = [
     "AppIdentity",
@@ -22,6 +22,7 @@ __all__ = [
     "ToolRegistry",
     "ToolResult",
     "ToolSpec",
+    "default_cache_path",
 ]
 
 __version__ = "0.1.0"
@@ -1,4 +1,4 @@
-"""Frozen/compiled executable detection.
+"""Frozen/compiled executable detection and Python-version shims.
 
 Detects whether the current process is running from Python source
 or a compiled executable (PyInstaller, cx_Freeze, etc.).
@@ -6,10 +6,16 @@ or a compiled executable (PyInstaller, cx_Freeze, etc.).
 
 from __future__ import annotations
 
+import os
 import sys
 from dataclasses import dataclass
-from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
+
+# ``@dataclass(slots=True)`` needs Python 3.10+; on 3.9 the classes simply
+# keep a per-instance ``__dict__``.
+DATACLASS_SLOTS: Dict[str, bool] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
 
 
 @dataclass(frozen=True)
@@ -29,15 +35,7 @@ class FrozenState:
     meipass: Optional[str]
 
 
-def detect_frozen() -> FrozenState:
-    """Detect whether the process is running from a bundled executable.
-
-    Checks ``sys.frozen`` (set by PyInstaller and cx_Freeze) and
-    ``sys._MEIPASS`` (PyInstaller-specific temp directory).
-
-    Returns:
-        A FrozenState describing the current execution environment.
-    """
+def _probe_frozen() -> FrozenState:
     frozen = getattr(sys, "frozen", False)
     meipass = getattr(sys, "_MEIPASS", None)
 
@@ -57,6 +55,31 @@ def detect_frozen() -> FrozenState:
     )
 
 
+# Bundlers set these attributes before any application code runs, so the
+# state is probed once at import.
+_STATE = _probe_frozen()
+
+
+def detect_frozen() -> FrozenState:
+    """Detect whether the process is running from a bundled executable.
+
+    Checks ``sys.frozen`` (set by PyInstaller and cx_Freeze) and
+    ``sys._MEIPASS`` (PyInstaller-specific temp directory).  The answer
+    can't change within a process, so it is computed once at import.
+
+    Returns:
+        A FrozenState describing the current execution environment.
+    """
+    return _STATE
+
+
+def _refresh() -> FrozenState:
+    """Re-probe ``sys`` (for tests that simulate a frozen interpreter)."""
+    global _STATE
+    _STATE = _probe_frozen()
+    return _STATE
+
+
 def resolve_code_location(caller_file: Optional[str] = None) -> str:
     """Return a meaningful path for where the code lives.
 
@@ -75,5 +98,5 @@ def resolve_code_location(caller_file: Optional[str] = None) -> str:
     if state.is_frozen:
         return state.executable_path
     if caller_file is not None:
-        return str(Path(caller_file).resolve())
+        return os.path.realpath(caller_file)
     return state.executable_path
@@ -9,14 +9,16 @@ from __future__ import annotations
 
 import platform
 import sys
-from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass, field, fields
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from ._compat import detect_frozen, resolve_code_location
+from ._compat import DATACLASS_SLOTS, detect_frozen, resolve_code_location
 from .tools import ToolRegistry, ToolResult
 
+_PYTHON_VERSION = sys.version.split()[0]
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class AppIdentity:
     """Static identity information supplied by the host application.
 
@@ -39,7 +41,7 @@ class AppIdentity:
     features: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ExecutionInfo:
     """Automatically detected runtime environment details.
 
@@ -63,91 +65,151 @@ class ExecutionInfo:
     bundler: Optional[str] = None
 
 
-@dataclass
+# Serialized field names, in declaration order (used to build AppInfo.to_dict)
+_IDENTITY_FIELDS = tuple(f.name for f in fields(AppIdentity))
+_EXECUTION_FIELDS = tuple(f.name for f in fields(ExecutionInfo))
+_TOOL_FIELDS = ToolResult._fields
+
+
+def _compile_to_dict() -> Callable[..., Dict[str, Any]]:
+    """Generate ``AppInfo.to_dict`` from the field-name tuples.
+
+    The body is a single nested dict literal with every key and attribute
+    access spelled out, which runs about twice as fast as building the
+    dicts with ``getattr()`` loops while still tracking new fields
+    automatically.
+    """
+
+    def dict_literal(obj: str, names: Tuple[str, ...], **exprs: str) -> str:
+        items = (f"{name!r}: {exprs.get(name, f'{obj}.{name}')}" for name in names)
+        return "{" + ", ".join(items) + "}"
+
+    identity = dict_literal("i", _IDENTITY_FIELDS, features="list(i.features)")
+    execution = dict_literal("e", _EXECUTION_FIELDS)
+    tool = dict_literal("t", _TOOL_FIELDS)
+    source = (
+        "def to_dict(self):\n"
+        "    i = self.identity\n"
+        "    e = self.execution\n"
+        "    return {\n"
+        f"        'identity': {identity},\n"
+        f"        'execution': {execution},\n"
+        f"        'tools': [{tool} for t in self.tools],\n"
+        "    }\n"
+    )
+    namespace: Dict[str, Any] = {}
+    exec(compile(source, "<AppInfo.to_dict>", "exec"), namespace)
+    to_dict = namespace["to_dict"]
+    to_dict.__qualname__ = "AppInfo.to_dict"
+    to_dict.__doc__ = "Serialize to a plain dict (useful for logging / JSON)."
+    return to_dict
+
+
+@dataclass(**DATACLASS_SLOTS)
 class AppInfo:
     """Complete application information — identity + environment + tools.
 
     Returned by ``gather_info()``.
+
+    Attributes:
+        identity: Static app identity.
+        execution: Detected runtime environment.
+        tools: Tool detection results.
+        registry: Registry whose tools have not been detected yet (set by
+            ``gather_info(lazy_tools=True)``); cleared by ``detect_tools()``
+            and ``set_tools()``.
     """
 
     identity: AppIdentity
     execution: ExecutionInfo
     tools: List[ToolResult] = field(default_factory=list)
+    registry: Optional[ToolRegistry] = field(default=None, repr=False, compare=False)
+    _summary: Optional[List[str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Serialize to a plain dict (useful for logging / JSON)."""
-        return {
-            "identity": {
-                "name": self.identity.name,
-                "short_name": self.identity.short_name,
-                "version": self.identity.version,
-                "commit_date": self.identity.commit_date,
-                "author": self.identity.author,
-                "description": self.identity.description,
-                "features": list(self.identity.features),
-            },
-            "execution": {
-                "python_executable": self.execution.python_executable,
-                "python_version": self.execution.python_version,
-                "code_location": self.execution.code_location,
-                "os_platform": self.execution.os_platform,
-                "is_frozen": self.execution.is_frozen,
-                "execution_mode": self.execution.execution_mode,
-                "bundler": self.execution.bundler,
-            },
-            "tools": [
-                {
-                    "name": t.name,
-                    "path": t.path,
-                    "version": t.version,
-                    "status": t.status,
-                }
-                for t in self.tools
-            ],
-        }
+    def detect_tools(self) -> List[ToolResult]:
+        """Run any deferred tool detection and return ``tools``."""
+        if self.registry is not None:
+            self.tools = self.registry.detect_all()
+            self.registry = None
+            self._summary = None
+        return self.tools
+
+    def set_tools(self, results: List[ToolResult]) -> None:
+        """Store deferred tool results that were detected elsewhere.
+
+        For callers such as ``AboutDialog`` that probe the registry's tools
+        themselves; unlike ``detect_tools()`` nothing is re-detected.
+        """
+        self.tools = results
+        self.registry = None
+        self._summary = None
+
+    to_dict = _compile_to_dict()
 
     @property
     def summary_lines(self) -> List[str]:
-        """Human-readable summary lines (handy for CLI output)."""
+        """Human-readable summary lines (handy for CLI output).
+
+        Built on first access and cached; ``AppInfo`` is treated as
+        immutable once gathered (``detect_tools()`` and ``set_tools()``
+        refresh the cache).
+        """
+        if self._summary is None:
+            self._summary = self._build_summary()
+        return list(self._summary)
+
+    def _build_summary(self) -> List[str]:
         ident = self.identity
         exe = self.execution
-        lines: List[str] = []
 
         title = ident.name
         if ident.short_name:
             title += f" [ {ident.short_name} ]"
-        lines.append(title)
 
-        if ident.version:
-            lines.append(f"  Version:      {ident.version}")
-        if ident.commit_date:
-            lines.append(f"  Commit Date:  {ident.commit_date}")
-        if ident.description:
-            lines.append(f"  {ident.description}")
+        header = (
+            (ident.version, f"  Version:      {ident.version}"),
+            (ident.commit_date, f"  Commit Date:  {ident.commit_date}"),
+            (ident.description, f"  {ident.description}"),
+        )
 
+        lines = [title]
+        lines.extend(text for present, text in header if present)
         lines.append("")
-        lines.append(f"  Execution:    {exe.execution_mode}")
-        lines.append(f"  Code:         {exe.code_location}")
-        lines.append(f"  Python:       {exe.python_executable}")
-        lines.append(f"  Python Ver:   {exe.python_version}")
-        lines.append(f"  OS:           {exe.os_platform}")
-
-        for tool in self.tools:
-            if tool.status == "available":
-                lines.append(f"  {tool.name}:  v{tool.version}  ({tool.path})")
-            elif tool.path:
-                lines.append(f"  {tool.name}:  found but version unavailable  ({tool.path})")
-            else:
-                lines.append(f"  {tool.name}:  not found")
-
+        lines.extend(_execution_lines(exe))
+        lines.extend(_tool_line(tool) for tool in self.tools)
         return lines
 
 
+def _execution_lines(exe: ExecutionInfo) -> List[str]:
+    """Summary lines describing the runtime environment."""
+    return [
+        f"  Execution:    {exe.execution_mode}",
+        f"  Code:         {exe.code_location}",
+        f"  Python:       {exe.python_executable}",
+        f"  Python Ver:   {exe.python_version}",
+        f"  OS:           {exe.os_platform}",
+    ]
+
+
+def _tool_line(tool: ToolResult) -> str:
+    """Summary line for one tool detection result."""
+    if tool.status == "available" and tool.version:
+        return f"  {tool.name}:  v{tool.version}  ({tool.path})"
+    if tool.status == "available":
+        return f"  {tool.name}:  {tool.path}"
+    if tool.path:
+        return f"  {tool.name}:  found but version unavailable  ({tool.path})"
+    return f"  {tool.name}:  not found"
+
+
 def gather_info(
     identity: AppIdentity,
     *,
     registry: Optional[ToolRegistry] = None,
     caller_file: Optional[str] = None,
+    lazy_tools: bool = False,
 ) -> AppInfo:
     """Detect the runtime environment and return a complete ``AppInfo``.
 
@@ -157,6 +219,10 @@ def gather_info(
             tool is detected and included in the result.
         caller_file: Typically ``__file__`` from the calling module.
             Used to resolve the code location when not frozen.
+        lazy_tools: Defer tool detection — the registry is attached to the
+            result and probed on the first ``AppInfo.detect_tools()`` call
+            (or in the background by ``AboutDialog``), so startup spawns no
+            subprocesses.
 
     Returns:
         An ``AppInfo`` combining *identity*, auto-detected execution
@@ -166,7 +232,7 @@ def gather_info(
 
     execution = ExecutionInfo(
         python_executable=sys.executable,
-        python_version=sys.version.split()[0],
+        python_version=_PYTHON_VERSION,
         code_location=resolve_code_location(caller_file),
         os_platform=platform.platform(),
         is_frozen=frozen_state.is_frozen,
@@ -176,8 +242,7 @@ def gather_info(
         bundler=frozen_state.bundler,
     )
 
-    tools: List[ToolResult] = []
-    if registry is not None:
-        tools = registry.detect_all()
-
-    return AppInfo(identity=identity, execution=execution, tools=tools)
+    info = AppInfo(identity=identity, execution=execution, registry=registry)
+    if not lazy_tools:
+        info.detect_tools()
+    return info
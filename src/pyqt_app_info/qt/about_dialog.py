@@ -2,24 +2,33 @@
 
 Takes a fully populated ``AppInfo`` from ``gather_info()`` and renders
 it in a two-section dialog: identity/features at the top, technical
-details (selectable) at the bottom.
+details (the same lines as ``AppInfo.summary_lines``, as selectable
+plain text) at the bottom.
+
+If tool detection was deferred (``gather_info(lazy_tools=True)``), the
+tools are probed on ``QThreadPool`` workers so the dialog paints
+immediately and each tool row fills in as its result arrives.
 """
 
 from __future__ import annotations
 
-from typing import Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, cast
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, Qt, pyqtSignal
+from PyQt6.QtGui import QFontDatabase
 from PyQt6.QtWidgets import (
     QDialog,
     QHBoxLayout,
     QLabel,
+    QPlainTextEdit,
     QPushButton,
     QVBoxLayout,
     QWidget,
 )
 
-from ..info import AppInfo
+from ..info import AppInfo, _execution_lines, _tool_line
+from ..tools import ToolRegistry, ToolResult
 
 
 class AboutDialog(QDialog):
@@ -37,7 +46,10 @@ class AboutDialog(QDialog):
     ) -> None:
         super().__init__(parent)
         self._app_info = app_info
+        # Tool name -> result, or None while detection is still running
+        self._tool_rows: Dict[str, Optional[ToolResult]] = {}
         self._build_ui()
+        self._start_tool_probes()
 
     # ------------------------------------------------------------------
     # UI construction
@@ -45,8 +57,6 @@ class AboutDialog(QDialog):
 
     def _build_ui(self) -> None:
         ident = self._app_info.identity
-        exe = self._app_info.execution
-        tools = self._app_info.tools
 
         # Window title
         title = f"About {ident.name}"
@@ -58,66 +68,36 @@ class AboutDialog(QDialog):
         layout = QVBoxLayout(self)
 
         # --- Section 1: Identity ---
-        heading = ident.name
-        if ident.short_name:
-            heading += f" [ {ident.short_name} ]"
-
-        parts = [f"<h3>{_esc(heading)}</h3>"]
-        if ident.version:
-            parts.append(f"<p><b>Version:</b> {_esc(ident.version)}</p>")
-        if ident.commit_date:
-            parts.append(f"<p><b>Commit Date:</b> {_esc(ident.commit_date)}</p>")
-        if ident.description:
-            parts.append(f"<br><p>{_esc(ident.description)}</p>")
-        if ident.features:
-            parts.append("<br><p><b>Features:</b></p><ul>")
-            for feat in ident.features:
-                parts.append(f"<li>{_esc(feat)}</li>")
-            parts.append("</ul>")
-
-        identity_label = QLabel("".join(parts))
+        identity_html = _identity_html(
+            ident.name,
+            ident.short_name,
+            ident.version,
+            ident.commit_date,
+            ident.description,
+            tuple(ident.features),
+        )
+
+        identity_label = QLabel(identity_html)
         identity_label.setTextFormat(Qt.TextFormat.RichText)
         identity_label.setWordWrap(True)
+        # Separator spacing as a margin rather than an extra layout item
+        identity_label.setContentsMargins(0, 0, 0, 10)
         layout.addWidget(identity_label)
 
-        # Separator spacing
-        layout.addSpacing(10)
-
         # --- Section 2: Technical info ---
-        tech_parts = [
-            f'<p style="font-size: 9pt; color: #666;">',
-            f"<b>Execution Mode:</b> {_esc(exe.execution_mode)}<br><br>",
-            f"<b>Code Location:</b><br>{_esc(exe.code_location)}<br><br>",
-            f"<b>Python Executable:</b><br>{_esc(exe.python_executable)}<br><br>",
-        ]
-
-        # Tools
-        for tool in tools:
-            if tool.status == "available":
-                tech_parts.append(
-                    f"<b>{_esc(tool.name)}:</b> v{_esc(tool.version or '')}<br>"
-                    f"{_esc(tool.path or '')}<br><br>"
-                )
-            elif tool.path:
-                tech_parts.append(
-                    f"<b>{_esc(tool.name)}:</b> Found but version unavailable<br>"
-                    f"{_esc(tool.path)}<br><br>"
-                )
-            else:
-                tech_parts.append(
-                    f"<b>{_esc(tool.name)}:</b> Not found in PATH<br><br>"
-                )
-
-        tech_parts.append(f"<b>OS:</b> {_esc(exe.os_platform)}")
-        tech_parts.append("</p>")
-
-        tech_label = QLabel("".join(tech_parts))
-        tech_label.setTextFormat(Qt.TextFormat.RichText)
-        tech_label.setWordWrap(True)
-        tech_label.setTextInteractionFlags(
-            Qt.TextInteractionFlag.TextSelectableByMouse
+        if self._app_info.registry is not None:
+            self._tool_rows = dict.fromkeys(self._app_info.registry.names)
+        else:
+            self._tool_rows = {t.name: t for t in self._app_info.tools}
+
+        # Plain text avoids Qt's rich-text parser for the longest section
+        self._tech_text = QPlainTextEdit()
+        self._tech_text.setReadOnly(True)
+        self._tech_text.setFont(
+            QFontDatabase.systemFont(QFontDatabase.SystemFont.FixedFont)
         )
-        layout.addWidget(tech_label)
+        self._tech_text.setPlainText(self._tech_plain_text())
+        layout.addWidget(self._tech_text)
 
         # --- OK button ---
         button_layout = QHBoxLayout()
@@ -129,11 +109,95 @@ class AboutDialog(QDialog):
         button_layout.addWidget(ok_btn)
         layout.addLayout(button_layout)
 
+    def _tech_plain_text(self) -> str:
+        lines = _execution_lines(self._app_info.execution)
+        for name, tool in self._tool_rows.items():
+            if tool is None:
+                lines.append(f"  {name}:  detecting…")
+            else:
+                lines.append(_tool_line(tool))
+        # Summary lines are indented under the app title; drop that here
+        return "\n".join(line[2:] for line in lines)
+
+    # ------------------------------------------------------------------
+    # Deferred tool detection
+    # ------------------------------------------------------------------
+
+    def _start_tool_probes(self) -> None:
+        registry = self._app_info.registry
+        if registry is None:
+            return
+        pool = QThreadPool.globalInstance()
+        assert pool is not None
+        for name in self._tool_rows:
+            probe = _ToolProbe(registry, name)
+            probe.signals.resultReady.connect(self._on_tool_result)
+            pool.start(probe)
+
+    def _on_tool_result(self, result: ToolResult) -> None:
+        self._tool_rows[result.name] = result
+        self._tech_text.setPlainText(self._tech_plain_text())
+
+        if None not in self._tool_rows.values():
+            # Hand over the collected results; detect_tools() would re-run
+            # detect_all() on the GUI thread if the cache had been cleared
+            self._app_info.set_tools(
+                cast(List[ToolResult], list(self._tool_rows.values()))
+            )
+
+
+class _ProbeSignals(QObject):
+    """Signal holder for ``_ToolProbe`` (QRunnable is not a QObject)."""
+
+    resultReady = pyqtSignal(object)
+
+
+class _ToolProbe(QRunnable):
+    """Detect one registered tool on a thread-pool worker."""
+
+    def __init__(self, registry: ToolRegistry, name: str) -> None:
+        super().__init__()
+        self.signals = _ProbeSignals()
+        self._registry = registry
+        self._name = name
+
+    def run(self) -> None:
+        self.signals.resultReady.emit(self._registry.detect(self._name))
+
+
+@lru_cache(maxsize=32)
+def _identity_html(
+    name: str,
+    short_name: str,
+    version: str,
+    commit_date: str,
+    description: str,
+    features: Tuple[str, ...],
+) -> str:
+    """Identity-section HTML, memoized since it is identical on every open."""
+    heading = name
+    if short_name:
+        heading += f" [ {short_name} ]"
+
+    features_html = ""
+    if features:
+        items = "".join(f"<li>{_esc(feat)}</li>" for feat in features)
+        features_html = f"<br><p><b>Features:</b></p><ul>{items}</ul>"
+
+    return "".join((
+        f"<h3>{_esc(heading)}</h3>",
+        f"<p><b>Version:</b> {_esc(version)}</p>" if version else "",
+        f"<p><b>Commit Date:</b> {_esc(commit_date)}</p>" if commit_date else "",
+        f"<br><p>{_esc(description)}</p>" if description else "",
+        features_html,
+    ))
+
 
 def _esc(text: str) -> str:
-    """Minimal HTML escaping for display strings."""
-    return (
-        text.replace("&", "&amp;")
-        .replace("<", "&lt;")
-        .replace(">", "&gt;")
-    )
+    """Minimal HTML escaping for display strings.
+
+    Equivalent to ``html.escape(text, quote=False)`` without the extra
+    call; chained ``str.replace`` also beats ``str.translate`` here, whose
+    multi-character mappings take a slow per-character path.
+    """
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
@@ -7,43 +7,75 @@ runtime.  Uses only the stdlib (``shutil.which``, ``subprocess``).
 
 from __future__ import annotations
 
+import json
+import os
 import shutil
 import subprocess
-from dataclasses import dataclass, field
-from pathlib import Path
-from typing import Dict, List, Optional
+import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
 
+from ._compat import DATACLASS_SLOTS
 
-@dataclass
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ToolSpec:
     """Specification for an external CLI tool to detect.
 
+    Specs are immutable and hashable; ``fallback_paths`` may be given as
+    any iterable and is stored as a tuple.
+
     Attributes:
         name: Human-readable display name (e.g. "ExifTool").
         command: Executable name passed to ``shutil.which()`` (e.g. "exiftool").
-        version_flag: CLI flag that prints the version (e.g. "-ver", "--version").
+        version_flag: CLI flag that prints the version (e.g. "-ver", "--version"),
+            or None to only locate the tool without running it.
         fallback_paths: Extra directories to probe when ``shutil.which()``
             returns nothing.  Each entry is a path to the *executable itself*,
-            not just the directory.
+            not just the directory; the first executable file wins.
         version_timeout: Seconds to wait for the version command.
+        known_version: Version to report without running the tool, e.g. for
+            a copy bundled with the app at a fixed version.  The executable
+            is still located; only the version subprocess is skipped.
     """
 
     name: str
     command: str
-    version_flag: str = "--version"
-    fallback_paths: List[str] = field(default_factory=list)
+    version_flag: Optional[str] = "--version"
+    fallback_paths: Tuple[str, ...] = ()
     version_timeout: float = 5.0
+    known_version: Optional[str] = None
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "fallback_paths", tuple(self.fallback_paths))
 
-@dataclass
-class ToolResult:
+
+class ToolResult(NamedTuple):
     """Detection result for a single tool.
 
+    An immutable tuple, so results can be shared freely between caches
+    and callers.
+
     Attributes:
         name: Display name (copied from ToolSpec).
         path: Absolute path to the executable, or None if not found.
         version: Version string reported by the tool, or None.
         status: One of ``"available"``, ``"not_found"``, ``"error"``.
+            An ``"available"`` tool has no version when probing was skipped.
     """
 
     name: str
@@ -52,6 +84,63 @@ class ToolResult:
     status: str = "not_found"  # "available" | "not_found" | "error"
 
 
+# Detection results are process-wide: a tool's path and version don't
+# change while the application is running, so each spec is probed once.
+_DetectKey = Tuple[str, str, Optional[str], Tuple[str, ...], Optional[str]]
+_DETECT_CACHE: Dict[_DetectKey, ToolResult] = {}
+
+# Below that, version strings keyed by the executable's identity on disk:
+# a re-detection (after invalidate(), or from another spec resolving to the
+# same binary) costs an os.stat() instead of a subprocess.
+_VersionKey = Tuple[str, str, int, int, int, int]
+_VERSION_CACHE: Dict[_VersionKey, str] = {}
+
+# One shared "not_found" result per tool name.  ToolResult is immutable,
+# so re-detecting a missing tool (after invalidate() or clear_cache())
+# hands back the same object instead of allocating a new one.
+_NOT_FOUND: Dict[str, ToolResult] = {}
+
+# Disk-cache entries already re-probed in the background this process, as
+# (cache file, entry key, executable path, mtime_ns).  The refresh rewrites
+# the entry, so later hits on the same executable are current.
+_REVALIDATED: Set[Tuple[str, str, str, int]] = set()
+
+# Concurrent background refreshes per cache file, matching detect_all()'s
+# default cap so a warm launch doesn't spawn every version probe at once
+_REVALIDATE_WORKERS = 8
+
+# One _DiskCache per resolved file, so registries pointed at the same path
+# share its lock and in-memory snapshot instead of overwriting each other
+_DISK_CACHES: Dict[str, "_DiskCache"] = {}
+
+_CACHE_LOCK = threading.Lock()
+
+
+def _cache_key(spec: ToolSpec, probe_version: bool) -> _DetectKey:
+    version_flag = spec.version_flag if probe_version else None
+    return (
+        spec.name, spec.command, version_flag, spec.fallback_paths, spec.known_version
+    )
+
+
+def _not_found(name: str) -> ToolResult:
+    result = _NOT_FOUND.get(name)
+    if result is None:
+        # setdefault keeps racing threads on a single shared instance
+        result = _NOT_FOUND.setdefault(name, ToolResult(name=name, status="not_found"))
+    return result
+
+
+def _cached_results(
+    specs: Tuple[ToolSpec, ...], use_cache: bool, probe_version: bool
+) -> List[Optional[ToolResult]]:
+    """Cached result per spec, or None for each spec still to be probed."""
+    if not use_cache:
+        return [None] * len(specs)
+    with _CACHE_LOCK:
+        return [_DETECT_CACHE.get(_cache_key(spec, probe_version)) for spec in specs]
+
+
 class ToolRegistry:
     """Registry of external tools to detect.
 
@@ -65,20 +154,63 @@ class ToolRegistry:
             fallback_paths=["/usr/local/bin/exiftool"],
         ))
         results = registry.detect_all()
+
+    Results are cached for the lifetime of the process; pass
+    ``use_cache=False``, or call ``invalidate()`` / ``clear_cache()``, to
+    force a fresh probe.
+
+    Args:
+        cache_path: Optional JSON file (see ``default_cache_path()``) that
+            persists probed versions across launches.  A tool whose
+            executable is unchanged is answered from the file immediately
+            and re-probed in the background (stale-while-revalidate).
     """
 
-    def __init__(self) -> None:
+    def __init__(self, cache_path: Optional[Union[str, os.PathLike]] = None) -> None:
         self._specs: Dict[str, ToolSpec] = {}
+        # Snapshot of _specs.values() for the detect_all() sweeps; rebuilt
+        # on the first sweep after a register()
+        self._ordered: Optional[Tuple[ToolSpec, ...]] = None
+        self._disk_cache: Optional[_DiskCache] = (
+            _shared_disk_cache(cache_path) if cache_path is not None else None
+        )
 
     def register(self, spec: ToolSpec) -> None:
-        """Register a tool specification."""
-        self._specs[spec.name] = spec
+        """Register a tool specification.
+
+        Specs are keyed by ``name``: registering a name again replaces its
+        spec but keeps its original position in ``names``/``detect_all()``.
+        """
+        # Interned keys let lookups with the same name object (literals, or
+        # names handed back by ``names``) match on identity alone.  Only
+        # exact str can be interned; subclasses (e.g. str-mixin Enum
+        # members) are stored as given.
+        name = spec.name
+        if type(name) is str:
+            name = sys.intern(name)
+        self._specs[name] = spec
+        self._ordered = None
+
+    @property
+    def names(self) -> List[str]:
+        """Registered tool names, in registration order."""
+        return list(self._specs)
 
-    def detect(self, name: str) -> ToolResult:
+    def detect(
+        self,
+        name: str,
+        *,
+        use_cache: bool = True,
+        probe_version: bool = True,
+    ) -> ToolResult:
         """Detect a single registered tool by name.
 
         Args:
             name: The ``ToolSpec.name`` that was registered.
+            use_cache: Return a previously cached result if available.
+                When False the tool is probed again and the cache updated.
+            probe_version: Run the tool's version command.  When False only
+                the path is resolved and no subprocess is spawned.
 
         Returns:
             A ToolResult with detection outcome.
@@ -87,51 +219,485 @@ class ToolRegistry:
             KeyError: If *name* was never registered.
         """
         spec = self._specs[name]
-        return self._detect_one(spec)
+        return self._detect_one(spec, use_cache, probe_version)
 
-    def detect_all(self) -> List[ToolResult]:
+    def _ordered_specs(self) -> Tuple[ToolSpec, ...]:
+        if self._ordered is None:
+            self._ordered = tuple(self._specs.values())
+        return self._ordered
+
+    def detect_all(
+        self,
+        *,
+        max_workers: Optional[int] = None,
+        use_cache: bool = True,
+        probe_version: bool = True,
+    ) -> List[ToolResult]:
         """Detect every registered tool.
 
+        Cached results are collected first; the remaining tools are probed
+        concurrently on a thread pool — each probe is dominated by waiting
+        on a version subprocess, so total latency is roughly that of the
+        slowest tool rather than the sum of all.  No pool is started when
+        at most one tool needs probing.
+
+        Args:
+            max_workers: Maximum number of concurrent probes.  Defaults to
+                one per tool still to probe, capped at 8.
+            use_cache: Return previously cached results where available.
+            probe_version: Run version commands; when False only paths are
+                resolved, so the call spawns no subprocesses.
+
         Returns:
             List of ToolResult in registration order.
         """
-        return [self._detect_one(spec) for spec in self._specs.values()]
+        specs = self._ordered_specs()
+        results = _cached_results(specs, use_cache, probe_version)
+        pending = [i for i, result in enumerate(results) if result is None]
+
+        def detect(i: int) -> ToolResult:
+            return self._detect_one(specs[i], use_cache, probe_version)
+
+        if len(pending) > 1:
+            workers = max_workers or min(8, len(pending))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                for i, result in zip(pending, pool.map(detect, pending)):
+                    results[i] = result
+        else:
+            for i in pending:
+                results[i] = detect(i)
+        return cast(List[ToolResult], results)
+
+    async def detect_all_async(
+        self,
+        *,
+        use_cache: bool = True,
+        probe_version: bool = True,
+    ) -> List[ToolResult]:
+        """Awaitable ``detect_all()`` for applications running an asyncio loop.
+
+        Uncached tools are probed concurrently on the running loop's
+        default executor, so the loop keeps servicing events meanwhile.
+        Version commands are still spawned with ``subprocess`` rather than
+        ``asyncio.create_subprocess_exec``, which Qt-integrated loops and
+        Windows selector loops don't support.
+
+        Args:
+            use_cache: Return previously cached results where available.
+            probe_version: Run version commands; when False only paths are
+                resolved, so the call spawns no subprocesses.
+
+        Returns:
+            List of ToolResult in registration order.
+        """
+        import asyncio
+
+        specs = self._ordered_specs()
+        results = _cached_results(specs, use_cache, probe_version)
+        pending = [i for i, result in enumerate(results) if result is None]
+        if pending:
+            loop = asyncio.get_running_loop()
+            probed = await asyncio.gather(*(
+                loop.run_in_executor(
+                    None, self._detect_one, specs[i], use_cache, probe_version
+                )
+                for i in pending
+            ))
+            for i, result in zip(pending, probed):
+                results[i] = result
+        return cast(List[ToolResult], results)
+
+    def invalidate(self, name: Optional[str] = None) -> None:
+        """Drop cached results for one registered tool, or all of them.
+
+        Unlike ``clear_cache()`` this only affects this registry's tools.
+        PATH is re-scanned on the next lookup, so newly installed tools are
+        found.  Versions of executables that haven't changed on disk are
+        still reused; pass ``use_cache=False`` to re-run the version command.
+
+        Raises:
+            KeyError: If *name* was never registered.
+        """
+        specs = [self._specs[name]] if name is not None else self._specs.values()
+        targets = {(spec.name, spec.command) for spec in specs}
+        with _CACHE_LOCK:
+            for key in [k for k in _DETECT_CACHE if k[:2] in targets]:
+                del _DETECT_CACHE[key]
+        _path_index.cache_clear()
+        _which_cached.cache_clear()
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Forget all cached detection results, versions and PATH lookups."""
+        with _CACHE_LOCK:
+            _DETECT_CACHE.clear()
+            _VERSION_CACHE.clear()
+            _REVALIDATED.clear()
+        _path_index.cache_clear()
+        _which_cached.cache_clear()
 
     # ------------------------------------------------------------------
     # Internal
     # ------------------------------------------------------------------
 
-    @staticmethod
-    def _detect_one(spec: ToolSpec) -> ToolResult:
-        """Run detection for a single ToolSpec."""
-        path = shutil.which(spec.command)
+    def _detect_one(
+        self,
+        spec: ToolSpec,
+        use_cache: bool = True,
+        probe_version: bool = True,
+    ) -> ToolResult:
+        """Run detection for a single ToolSpec, consulting the cache."""
+        version_flag = spec.version_flag if probe_version else None
+        key = _cache_key(spec, probe_version)
+        if use_cache:
+            with _CACHE_LOCK:
+                cached = _DETECT_CACHE.get(key)
+            if cached is not None:
+                return cached
 
-        # Fallback paths
-        if path is None:
-            for candidate in spec.fallback_paths:
-                if Path(candidate).is_file():
-                    path = candidate
-                    break
+        result, provisional = self._probe(spec, version_flag, key, use_cache)
+        with _CACHE_LOCK:
+            if provisional:
+                # Don't clobber a fresh result the background refresh may
+                # already have stored
+                return _DETECT_CACHE.setdefault(key, result)
+            _DETECT_CACHE[key] = result
+        return result
 
+    def _probe(
+        self,
+        spec: ToolSpec,
+        version_flag: Optional[str],
+        key: _DetectKey,
+        use_cache: bool,
+    ) -> Tuple[ToolResult, bool]:
+        """Locate *spec* and query its version, bypassing the memory cache.
+
+        Returns the result and whether it is provisional: answered from the
+        disk cache while a background refresh re-probes the tool.
+        """
+        path = _locate(spec, use_cache)
         if path is None:
-            return ToolResult(name=spec.name, status="not_found")
+            return _not_found(spec.name), False
 
-        # Try to get version
-        try:
-            proc = subprocess.run(
-                [path, spec.version_flag],
-                capture_output=True,
-                text=True,
-                timeout=spec.version_timeout,
+        if version_flag is None or spec.known_version is not None:
+            result = ToolResult(
+                name=spec.name,
+                path=path,
+                version=spec.known_version,
+                status="available",
             )
-            if proc.returncode == 0:
-                version = proc.stdout.strip().split("\n")[0]
+            return result, False
+
+        disk = self._disk_cache
+        if disk is None:
+            return _query_version(spec, path, version_flag, use_cache), False
+
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            return _query_version(spec, path, version_flag, use_cache), False
+
+        disk_key = f"{spec.command} {version_flag}"
+        entry = disk.get(disk_key, path, mtime_ns) if use_cache else None
+        if entry is None:
+            result = _query_version(spec, path, version_flag, use_cache)
+            disk.put(disk_key, _disk_entry(result, mtime_ns))
+            return result, False
+
+        def revalidate() -> None:
+            fresh = _query_version(spec, path, version_flag, use_cache=False)
+            disk.put(disk_key, _disk_entry(fresh, mtime_ns))
+            with _CACHE_LOCK:
+                _DETECT_CACHE[key] = fresh
+
+        token = (disk.path, disk_key, path, mtime_ns)
+        with _CACHE_LOCK:
+            stale = token not in _REVALIDATED
+            _REVALIDATED.add(token)
+        if stale:
+            disk.revalidate(revalidate)
+        result = ToolResult(
+            name=spec.name,
+            path=path,
+            version=entry.get("version"),
+            status=entry.get("status", "available"),
+        )
+        return result, True
+
+
+def default_cache_path() -> str:
+    """Per-user location for a persistent ``ToolRegistry`` cache file.
+
+    ``$XDG_CACHE_HOME/pyqt-app-info/tools.json`` (falling back to
+    ``~/.cache``), or under ``%LOCALAPPDATA%`` on Windows.
+    """
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+            os.path.expanduser("~"), ".cache"
+        )
+    return os.path.join(base, "pyqt-app-info", "tools.json")
+
+
+class _DiskCache:
+    """JSON file of probed tool versions, shared across process launches.
+
+    Entries are keyed by command + version flag and remember the
+    executable's path and mtime; a hit is only trusted while both still
+    match.  I/O errors are swallowed — the cache is an optimization, never
+    a requirement.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        # Started on the first revalidation
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Revalidations queued or running; each removes itself when done
+        self._refreshers: Set[Future] = set()
+
+    def get(self, key: str, path: str, mtime_ns: int) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._load().get(key)
+        if (
+            isinstance(entry, dict)
+            and entry.get("path") == path
+            and entry.get("mtime_ns") == mtime_ns
+        ):
+            return entry
+        return None
+
+    def put(self, key: str, entry: Dict[str, Any]) -> None:
+        with self._lock:
+            entries = self._load()
+            if entries.get(key) == entry:
+                return
+            entries[key] = entry
+            self._save(entries)
+
+    def revalidate(self, refresh: Callable[[], None]) -> None:
+        """Queue *refresh* on this cache's background pool.
+
+        At most ``_REVALIDATE_WORKERS`` refreshes run at once; the rest
+        wait their turn.
+        """
+
+        def run() -> None:
+            try:
+                refresh()
+            finally:
+                # submit() and add() below happen under the same lock
+                with self._lock:
+                    self._refreshers.discard(future)
+
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=_REVALIDATE_WORKERS,
+                    thread_name_prefix="pyqt-app-info-revalidate",
+                )
+            future = self._executor.submit(run)
+            self._refreshers.add(future)
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        """Wait for pending background revalidations (used by tests)."""
+        with self._lock:
+            pending = list(self._refreshers)
+        wait(pending, timeout)
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if self._entries is None:
+            try:
+                with open(self.path, encoding="utf-8") as fh:
+                    data = json.load(fh)
+            except (OSError, ValueError):
+                data = {}
+            self._entries = data if isinstance(data, dict) else {}
+        return self._entries
+
+    def _save(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        # Write-then-rename so a concurrent reader never sees a torn file
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(tmp, "w", encoding="utf-8") as fh:
+                json.dump(entries, fh, indent=2, sort_keys=True)
+            os.replace(tmp, self.path)
+        except OSError:
+            pass
+
+
+def _shared_disk_cache(cache_path: Union[str, os.PathLike]) -> _DiskCache:
+    path = os.path.abspath(os.fspath(cache_path))
+    with _CACHE_LOCK:
+        disk = _DISK_CACHES.get(path)
+        if disk is None:
+            disk = _DISK_CACHES[path] = _DiskCache(path)
+    return disk
+
+
+def _disk_entry(result: ToolResult, mtime_ns: int) -> Dict[str, Any]:
+    return {
+        "path": result.path,
+        "mtime_ns": mtime_ns,
+        "version": result.version,
+        "status": result.status,
+    }
+
+
+@lru_cache(maxsize=4)
+def _path_index(path_env: str) -> Dict[str, str]:
+    """Map executable names found on *path_env* to their full paths.
+
+    One ``os.scandir`` per PATH directory, first directory wins — so
+    looking up N tools costs one PATH walk instead of N.  On Windows names
+    are case-folded and indexed both with and without their ``PATHEXT``
+    extension; within a directory the bare name resolves in ``PATHEXT``
+    order, as ``shutil.which`` does.
+    """
+    windows = sys.platform == "win32"
+    if windows:
+        ext_rank: Dict[str, int] = {}
+        for ext in os.environ.get("PATHEXT", ".COM;.EXE;.BAT;.CMD").split(";"):
+            if ext:
+                ext_rank.setdefault(ext.lower(), len(ext_rank))
+
+    index: Dict[str, str] = {}
+    for directory in path_env.split(os.pathsep):
+        if not directory:
+            continue
+        # Bare name -> (PATHEXT rank, path) for this directory (Windows)
+        stems: Dict[str, Tuple[int, str]] = {}
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if not windows:
+                        index.setdefault(entry.name, entry.path)
+                        continue
+                    name = entry.name.lower()
+                    stem, ext = os.path.splitext(name)
+                    rank = ext_rank.get(ext)
+                    if rank is None:
+                        continue
+                    index.setdefault(name, entry.path)
+                    if stem not in stems or rank < stems[stem][0]:
+                        stems[stem] = (rank, entry.path)
+        except OSError:
+            continue
+        for stem, (_, path) in stems.items():
+            index.setdefault(stem, path)
+    return index
+
+
+@lru_cache(maxsize=256)
+def _which_cached(command: str, path_env: str) -> Optional[str]:
+    """``shutil.which`` memoized per PATH value, so misses walk PATH once."""
+    return shutil.which(command, path=path_env)
+
+
+def _which(command: str, use_cache: bool = True) -> Optional[str]:
+    """``shutil.which`` backed by the cached PATH index.
+
+    Index hits are checked for being an executable file; misses (and
+    commands containing a directory) go through ``_which_cached()``.
+    With ``use_cache=False`` PATH is searched afresh, bypassing both.
+    """
+    path_env = os.environ.get("PATH", os.defpath)
+    if not use_cache:
+        return shutil.which(command, path=path_env)
+    if not os.path.dirname(command):
+        key = command.lower() if sys.platform == "win32" else command
+        path = _path_index(path_env).get(key)
+        if path is not None and os.path.isfile(path) and os.access(path, os.X_OK):
+            return path
+    return _which_cached(command, path_env)
+
+
+def _locate(spec: ToolSpec, use_cache: bool = True) -> Optional[str]:
+    """Resolve *spec* to an executable path via PATH, then fallback paths."""
+    path = _which(spec.command, use_cache)
+    if path is None:
+        for candidate in spec.fallback_paths:
+            if os.path.isfile(candidate) and os.access(candidate, os.X_OK):
+                return candidate
+    return path
+
+
+# On POSIX, close_fds=False lets subprocess use posix_spawn() instead of
+# fork+exec.  Descriptors opened by Python are non-inheritable (PEP 446);
+# ones inherited by the process or opened by C code (extensions, Qt
+# plugins) without CLOEXEC may still reach the short-lived probe.
+# Windows keeps the default.
+_CLOSE_FDS = sys.platform == "win32"
+
+
+def _query_version(
+    spec: ToolSpec,
+    path: str,
+    version_flag: str,
+    use_cache: bool = True,
+) -> ToolResult:
+    """Run ``path version_flag`` and build the ToolResult from its output.
+
+    Successful results are remembered in ``_VERSION_CACHE`` for as long as
+    the file at *path* keeps its inode and ctime/mtime.  Package managers
+    install upgrades by renaming a new file into place, which changes the
+    inode; any in-place write bumps ctime (mtime on Windows, where
+    ``st_ctime`` is the creation time).  The path stays in the key because
+    multi-call binaries such as busybox answer per ``argv[0]``.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        key = None
+    else:
+        key = (
+            path, version_flag, st.st_dev, st.st_ino, st.st_ctime_ns, st.st_mtime_ns
+        )
+        if use_cache:
+            with _CACHE_LOCK:
+                version = _VERSION_CACHE.get(key)
+            if version is not None:
                 return ToolResult(
-                    name=spec.name,
-                    path=path,
-                    version=version,
-                    status="available",
+                    name=spec.name, path=path, version=version, status="available"
                 )
+
+    try:
+        # Only stdout's first line is used: send stderr straight to the null
+        # device and decode stdout ourselves rather than via text=True.
+        # stdin is closed off too, so a tool that reads it can't block on
+        # (or inherit) the app's console.
+        proc = subprocess.Popen(
+            [path, version_flag],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            close_fds=_CLOSE_FDS,
+        )
+    except OSError:
+        return ToolResult(name=spec.name, path=path, status="error")
+
+    with proc:
+        try:
+            stdout, _ = proc.communicate(timeout=spec.version_timeout)
+        except subprocess.TimeoutExpired:
+            # Kill and let __exit__ wait() on the child.  A second
+            # communicate(), as subprocess.run() does, can block forever on
+            # Windows when a grandchild still holds the pipe open.
+            proc.kill()
             return ToolResult(name=spec.name, path=path, status="error")
-        except (subprocess.TimeoutExpired, OSError):
-            return ToolResult(name=spec.name, path=path, status="error")
+
+    if proc.returncode != 0:
+        return ToolResult(name=spec.name, path=path, status="error")
+
+    # Cut the first line out of the raw bytes so long banners are never
+    # split into lists or decoded in full
+    first_line = stdout.lstrip().partition(b"\n")[0]
+    version = first_line.decode("utf-8", errors="replace").rstrip()
+    if key is not None:
+        with _CACHE_LOCK:
+            _VERSION_CACHE[key] = version
+    return ToolResult(name=spec.name, path=path, version=version, status="available")
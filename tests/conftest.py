@@ -0,0 +1,19 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+from pyqt_app_info import _compat
+from pyqt_app_info.tools import ToolRegistry
+
+
+def _clear_caches() -> None:
+    ToolRegistry.clear_cache()
+    _compat._refresh()
+
+
+@pytest.fixture(autouse=True)
+def _clear_detection_cache():
+    """Keep cached detection results from leaking between tests."""
+    _clear_caches()
+    yield
+    _clear_caches()
@@ -11,7 +11,7 @@ import sys
 import pytest
 
 from pyqt_app_info.info import AppIdentity, AppInfo, ExecutionInfo
-from pyqt_app_info.tools import ToolResult
+from pyqt_app_info.tools import ToolRegistry, ToolResult, ToolSpec
 
 
 def _pyqt6_available() -> bool:
@@ -26,6 +26,12 @@ pytestmark = pytest.mark.skipif(
     not _pyqt6_available(), reason="PyQt6 not installed"
 )
 
+if _pyqt6_available():
+    from PyQt6.QtWidgets import QPlainTextEdit
+
+    from pyqt_app_info.qt import AboutDialog
+    from pyqt_app_info.qt.about_dialog import _esc, _identity_html
+
 
 def _make_app_info() -> AppInfo:
     return AppInfo(
@@ -59,21 +65,26 @@ class TestAboutDialogImport:
     """Verify the qt subpackage imports work."""
 
     def test_import_about_dialog(self):
-        from pyqt_app_info.qt import AboutDialog
-        assert AboutDialog is not None
+        from pyqt_app_info.qt import AboutDialog as imported
+        assert imported is AboutDialog
 
     def test_construct_dialog(self, qapp):
         """Construct the dialog (requires a QApplication via qapp fixture)."""
-        from pyqt_app_info.qt import AboutDialog
-
         info = _make_app_info()
         dialog = AboutDialog(info)
         assert dialog.windowTitle().startswith("About Test App")
 
+    def test_technical_section_text(self, qapp):
+        """Technical details are plain text built from the summary lines."""
+        dialog = AboutDialog(_make_app_info())
+        text = dialog.findChild(QPlainTextEdit).toPlainText()
+        assert "Execution:    Python source" in text
+        assert "ExifTool:  v12.50  (/usr/bin/exiftool)" in text
+        assert "Missing:  not found" in text
+        assert "OS:           Linux-Test" in text
+
     def test_dialog_with_no_tools(self, qapp):
         """Dialog handles empty tool list."""
-        from pyqt_app_info.qt import AboutDialog
-
         info = AppInfo(
             identity=AppIdentity(name="Minimal"),
             execution=ExecutionInfo(),
@@ -84,8 +95,6 @@ class TestAboutDialogImport:
 
     def test_dialog_with_no_features(self, qapp):
         """Dialog handles identity with no features."""
-        from pyqt_app_info.qt import AboutDialog
-
         info = AppInfo(
             identity=AppIdentity(name="NoFeat", version="0.1"),
             execution=ExecutionInfo(
@@ -95,3 +104,49 @@ class TestAboutDialogImport:
         )
         dialog = AboutDialog(info)
         assert dialog is not None
+
+    def test_dialog_detects_lazy_tools(self, qtbot):
+        """Dialog probes deferred tools in the background."""
+        reg = ToolRegistry()
+        reg.register(ToolSpec(name="FakeTool", command="no_such_binary_xyz"))
+        info = AppInfo(
+            identity=AppIdentity(name="Lazy"),
+            execution=ExecutionInfo(),
+            registry=reg,
+        )
+        dialog = AboutDialog(info)
+        qtbot.addWidget(dialog)
+        qtbot.waitUntil(lambda: info.registry is None)
+        assert [t.name for t in info.tools] == ["FakeTool"]
+        assert info.tools[0].status == "not_found"
+
+        text = dialog.findChild(QPlainTextEdit).toPlainText()
+        assert "FakeTool:  not found" in text
+        assert "detecting" not in text
+
+
+class TestIdentityHtml:
+    """Identity-section rendering."""
+
+    def test_identity_html_memoized(self, qapp):
+        """A second dialog for the same identity reuses the rendered HTML."""
+        _identity_html.cache_clear()
+        AboutDialog(_make_app_info())
+        AboutDialog(_make_app_info())
+        info = _identity_html.cache_info()
+        assert (info.misses, info.hits) == (1, 1)
+
+    def test_identity_html_content(self):
+        html = _identity_html("A&B", "AB", "1.0", "", "", ("<x>",))
+        assert "<h3>A&amp;B [ AB ]</h3>" in html
+        assert "<b>Version:</b> 1.0" in html
+        assert "Commit Date" not in html
+        assert "<li>&lt;x&gt;</li>" in html
+
+
+class TestEscape:
+    """HTML escaping of display strings."""
+
+    def test_escapes_markup_but_not_quotes(self):
+        assert _esc('<b>"R&D"</b>') == '&lt;b&gt;"R&amp;D"&lt;/b&gt;'
+        assert _esc("plain") == "plain"
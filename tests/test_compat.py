@@ -4,7 +4,12 @@ import sys
 from pathlib import Path
 from unittest.mock import patch
 
-from pyqt_app_info._compat import FrozenState, detect_frozen, resolve_code_location
+from pyqt_app_info._compat import (
+    FrozenState,
+    _refresh,
+    detect_frozen,
+    resolve_code_location,
+)
 
 
 class TestDetectFrozen:
@@ -22,6 +27,7 @@ class TestDetectFrozen:
         """Simulate PyInstaller: sys.frozen=True, sys._MEIPASS set."""
         with patch.object(sys, "frozen", True, create=True), \
              patch.object(sys, "_MEIPASS", "/tmp/fake_meipass", create=True):
+            _refresh()
             state = detect_frozen()
             assert state.is_frozen is True
             assert state.bundler == "PyInstaller"
@@ -34,12 +40,25 @@ class TestDetectFrozen:
             if hasattr(sys, "_MEIPASS"):
                 with patch.object(sys, "_MEIPASS", None, create=True):
                     pass  # shouldn't happen in normal test env
+            _refresh()
             state = detect_frozen()
             # When no _MEIPASS is set on sys, it should detect cx_Freeze
             # (but only if frozen is True)
             if not hasattr(sys, "_MEIPASS"):
                 assert state.bundler == "cx_Freeze"
 
+    def test_result_is_cached(self):
+        """Repeated calls return the same FrozenState instance."""
+        assert detect_frozen() is detect_frozen()
+
+    def test_state_fixed_until_refresh(self):
+        """Later changes to sys are only picked up by _refresh()."""
+        before = detect_frozen()
+        with patch.object(sys, "frozen", True, create=True):
+            assert detect_frozen() is before
+            assert _refresh().is_frozen is True
+        assert _refresh().is_frozen is False
+
     def test_frozen_state_is_immutable(self):
         """FrozenState is a frozen dataclass."""
         state = detect_frozen()
@@ -67,5 +86,6 @@ class TestResolveCodeLocation:
         """When frozen, always returns sys.executable."""
         with patch.object(sys, "frozen", True, create=True), \
              patch.object(sys, "_MEIPASS", "/tmp/mei", create=True):
+            _refresh()
             result = resolve_code_location("/some/source/file.py")
             assert result == sys.executable
@@ -3,6 +3,9 @@
 import sys
 from unittest.mock import patch
 
+import pytest
+
+from pyqt_app_info._compat import _refresh
 from pyqt_app_info.info import AppIdentity, AppInfo, ExecutionInfo, gather_info
 from pyqt_app_info.tools import ToolRegistry, ToolResult, ToolSpec
 
@@ -29,6 +32,13 @@ class TestAppIdentity:
         assert ident.short_name == "MA"
         assert len(ident.features) == 2
 
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="slots need 3.10+")
+    def test_slots_reject_unknown_attributes(self):
+        ident = AppIdentity(name="TestApp")
+        assert not hasattr(ident, "__dict__")
+        with pytest.raises(AttributeError):
+            ident.nmae = "typo"  # type: ignore[attr-defined]
+
 
 class TestGatherInfo:
     """Tests for gather_info()."""
@@ -55,11 +65,32 @@ class TestGatherInfo:
         assert info.tools[0].name == "FakeTool"
         assert info.tools[0].status == "not_found"
 
+    def test_gather_lazy_tools(self):
+        """lazy_tools defers detection until detect_tools() is called."""
+        ident = AppIdentity(name="Test")
+        reg = ToolRegistry()
+        reg.register(ToolSpec(name="FakeTool", command="no_such_binary_xyz"))
+
+        with patch.object(reg, "detect_all", wraps=reg.detect_all) as detect_all:
+            info = gather_info(ident, registry=reg, lazy_tools=True)
+            assert info.tools == []
+            assert info.registry is reg
+            detect_all.assert_not_called()
+
+            tools = info.detect_tools()
+            assert [t.name for t in tools] == ["FakeTool"]
+            assert info.tools is tools
+            assert info.registry is None
+
+            info.detect_tools()
+            assert detect_all.call_count == 1
+
     def test_gather_frozen(self):
         """gather_info detects frozen mode."""
         ident = AppIdentity(name="Frozen")
         with patch.object(sys, "frozen", True, create=True), \
              patch.object(sys, "_MEIPASS", "/tmp/mei", create=True):
+            _refresh()
             info = gather_info(ident)
             assert info.execution.is_frozen is True
             assert info.execution.execution_mode == "Compiled executable"
@@ -101,6 +132,28 @@ class TestAppInfo:
         assert len(d["tools"]) == 2
         assert d["tools"][0]["status"] == "available"
 
+    def test_to_dict_full_shape(self):
+        """Every dataclass field is serialized, in declaration order."""
+        info = self._make_info()
+        d = info.to_dict()
+        assert list(d) == ["identity", "execution", "tools"]
+        assert list(d["identity"]) == [
+            "name", "short_name", "version", "commit_date",
+            "author", "description", "features",
+        ]
+        assert list(d["execution"]) == [
+            "python_executable", "python_version", "code_location",
+            "os_platform", "is_frozen", "execution_mode", "bundler",
+        ]
+        assert d["tools"][0] == {
+            "name": "ExifTool",
+            "path": "/usr/bin/exiftool",
+            "version": "12.50",
+            "status": "available",
+        }
+        assert d["identity"]["features"] == ["Feature A"]
+        assert d["identity"]["features"] is not info.identity.features
+
     def test_summary_lines(self):
         lines = self._make_info().summary_lines
         assert any("Demo App" in l for l in lines)
@@ -108,6 +161,51 @@ class TestAppInfo:
         assert any("ExifTool" in l and "12.50" in l for l in lines)
         assert any("Missing" in l and "not found" in l for l in lines)
 
+    def test_summary_lines_cached(self):
+        """summary_lines is built once; callers get independent copies."""
+        info = self._make_info()
+        with patch.object(AppInfo, "_build_summary",
+                          wraps=info._build_summary) as build:
+            first = info.summary_lines
+            first.append("mutated")
+            second = info.summary_lines
+        assert build.call_count == 1
+        assert "mutated" not in second
+
+    def test_summary_lines_refreshed_by_detect_tools(self):
+        """Deferred detection invalidates the cached summary."""
+        reg = ToolRegistry()
+        reg.register(ToolSpec(name="FakeTool", command="no_such_binary_xyz"))
+        info = gather_info(AppIdentity(name="X"), registry=reg, lazy_tools=True)
+        assert not any("FakeTool" in l for l in info.summary_lines)
+        info.detect_tools()
+        assert any("FakeTool" in l for l in info.summary_lines)
+
+    def test_set_tools_skips_detection(self):
+        """set_tools() stores given results without re-probing the registry."""
+        reg = ToolRegistry()
+        reg.register(ToolSpec(name="FakeTool", command="no_such_binary_xyz"))
+        info = gather_info(AppIdentity(name="X"), registry=reg, lazy_tools=True)
+        assert not any("FakeTool" in l for l in info.summary_lines)
+        result = ToolResult(name="FakeTool", path="/opt/fake", status="available")
+        with patch.object(ToolRegistry, "detect_all") as detect_all:
+            info.set_tools([result])
+            assert info.detect_tools() == [result]
+        detect_all.assert_not_called()
+        assert info.registry is None
+        assert any("FakeTool" in l and "/opt/fake" in l for l in info.summary_lines)
+
+    def test_summary_lines_path_only_tool(self):
+        """Available tool without a probed version shows just its path."""
+        info = AppInfo(
+            identity=AppIdentity(name="X"),
+            execution=ExecutionInfo(),
+            tools=[ToolResult(name="Git", path="/usr/bin/git", status="available")],
+        )
+        lines = info.summary_lines
+        assert "  Git:  /usr/bin/git" in lines
+        assert not any("vNone" in l for l in lines)
+
     def test_summary_lines_tool_error(self):
         """Tool with path but no version shows 'found but version unavailable'."""
         info = AppInfo(
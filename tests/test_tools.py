@@ -1,8 +1,94 @@
 """Tests for tools — ToolSpec, ToolResult, ToolRegistry."""
 
-from unittest.mock import MagicMock, patch
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+from types import SimpleNamespace
 
-from pyqt_app_info.tools import ToolRegistry, ToolResult, ToolSpec
+import pytest
+
+from pyqt_app_info.tools import (
+    ToolRegistry,
+    ToolResult,
+    ToolSpec,
+    _DiskCache,
+    _path_index,
+    _which,
+    default_cache_path,
+)
+
+
+class _FakeProc(SimpleNamespace):
+    """Just enough of ``subprocess.Popen`` for the version probe.
+
+    Much cheaper to build than a MagicMock; ``with proc:`` needs the
+    context-manager methods on the class, hence the subclass.
+    """
+
+    def __enter__(self) -> "_FakeProc":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+
+@pytest.fixture(scope="module")
+def fake_proc():
+    """Factory for fake ``Popen`` objects: ``fake_proc(stdout, returncode=0)``.
+
+    With ``raises``, ``communicate()`` raises it instead.  Each fake records
+    the ``timeout`` it was given and whether it was ``killed``.
+    """
+
+    def make(stdout=b"", returncode=0, raises=None):
+        proc = _FakeProc(returncode=returncode, timeout=None, killed=False)
+
+        def communicate(timeout=None):
+            proc.timeout = timeout
+            if raises is not None:
+                raise raises
+            return stdout, None
+
+        def kill():
+            proc.killed = True
+
+        proc.communicate = communicate
+        proc.kill = kill
+        return proc
+
+    return make
+
+
+_WHICH = "pyqt_app_info.tools.shutil.which"
+_POPEN = "pyqt_app_info.tools.subprocess.Popen"
+
+
+def _recorder(result=None, *, wraps=None):
+    """Stand-in callable for ``monkeypatch.setattr``.
+
+    Returns ``result`` (or forwards to ``wraps``) and appends each
+    ``(args, kwargs)`` to ``calls``.  ``result`` may be reassigned mid-test.
+    """
+
+    def fake(*args, **kwargs):
+        fake.calls.append((args, kwargs))
+        return wraps(*args, **kwargs) if wraps is not None else fake.result
+
+    fake.calls = []
+    fake.result = result
+    return fake
+
+
+@pytest.fixture(autouse=True)
+def _isolated_path(monkeypatch, tmp_path):
+    """Keep the host's real executables out of the PATH index."""
+    monkeypatch.setenv("PATH", str(tmp_path / "no-such-bin"))
 
 
 class TestToolSpec:
@@ -11,8 +97,35 @@ class TestToolSpec:
     def test_defaults(self):
         spec = ToolSpec(name="Foo", command="foo")
         assert spec.version_flag == "--version"
-        assert spec.fallback_paths == []
+        assert spec.fallback_paths == ()
         assert spec.version_timeout == 5.0
+        assert spec.known_version is None
+
+    def test_fallback_paths_stored_as_tuple(self):
+        spec = ToolSpec(name="Foo", command="foo", fallback_paths=["/opt/foo"])
+        assert spec.fallback_paths == ("/opt/foo",)
+
+    def test_frozen_and_hashable(self):
+        spec = ToolSpec(name="Foo", command="foo", fallback_paths=["/opt/foo"])
+        assert hash(spec) == hash(ToolSpec(name="Foo", command="foo",
+                                           fallback_paths=("/opt/foo",)))
+        with pytest.raises(AttributeError):
+            spec.command = "bar"  # type: ignore[misc]
+
+
+class TestToolResult:
+    """ToolResult defaults and immutability."""
+
+    def test_defaults(self):
+        result = ToolResult(name="Foo")
+        assert result.path is None
+        assert result.version is None
+        assert result.status == "not_found"
+
+    def test_immutable(self):
+        result = ToolResult(name="Foo")
+        with pytest.raises(AttributeError):
+            result.status = "available"  # type: ignore[misc]
 
 
 class TestToolRegistry:
@@ -24,33 +137,35 @@ class TestToolRegistry:
             reg.register(s)
         return reg
 
-    def test_detect_available_via_which(self):
+    def test_detect_available_via_which(self, monkeypatch, fake_proc):
         """Tool found via shutil.which and version retrieved."""
         spec = ToolSpec(name="ExifTool", command="exiftool", version_flag="-ver")
         reg = self._make_registry(spec)
 
-        mock_proc = MagicMock()
-        mock_proc.returncode = 0
-        mock_proc.stdout = "12.50\n"
+        monkeypatch.setattr(_WHICH, _recorder("/usr/bin/exiftool"))
+        monkeypatch.setattr(_POPEN, _recorder(fake_proc(b"12.50\n")))
 
-        with patch("pyqt_app_info.tools.shutil.which", return_value="/usr/bin/exiftool"), \
-             patch("pyqt_app_info.tools.subprocess.run", return_value=mock_proc):
-            result = reg.detect("ExifTool")
-            assert result.status == "available"
-            assert result.path == "/usr/bin/exiftool"
-            assert result.version == "12.50"
+        result = reg.detect("ExifTool")
+        assert result.status == "available"
+        assert result.path == "/usr/bin/exiftool"
+        assert result.version == "12.50"
 
-    def test_detect_not_found(self):
+    def test_detect_not_found(self, monkeypatch):
         """Tool not found anywhere."""
         spec = ToolSpec(name="Missing", command="no_such_tool")
         reg = self._make_registry(spec)
 
-        with patch("pyqt_app_info.tools.shutil.which", return_value=None):
-            result = reg.detect("Missing")
-            assert result.status == "not_found"
-            assert result.path is None
+        monkeypatch.setattr(_WHICH, _recorder(None))
+
+        result = reg.detect("Missing")
+        assert result.status == "not_found"
+        assert result.path is None
 
-    def test_detect_fallback_path(self):
+        # Misses are shared, even across a re-probe
+        reg.invalidate()
+        assert reg.detect("Missing") is result
+
+    def test_detect_fallback_path(self, monkeypatch, fake_proc):
         """Tool found via fallback path when shutil.which fails."""
         spec = ToolSpec(
             name="ExifTool",
@@ -60,56 +175,326 @@ class TestToolRegistry:
         )
         reg = self._make_registry(spec)
 
-        mock_proc = MagicMock()
-        mock_proc.returncode = 0
-        mock_proc.stdout = "12.40\n"
+        monkeypatch.setattr(_WHICH, _recorder(None))
+        monkeypatch.setattr("pyqt_app_info.tools.os.path.isfile", _recorder(True))
+        monkeypatch.setattr("pyqt_app_info.tools.os.access", _recorder(True))
+        monkeypatch.setattr(_POPEN, _recorder(fake_proc(b"12.40\n")))
+
+        result = reg.detect("ExifTool")
+        assert result.status == "available"
+        assert result.path == "/opt/exiftool/exiftool"
 
-        with patch("pyqt_app_info.tools.shutil.which", return_value=None), \
-             patch("pyqt_app_info.tools.Path.is_file", return_value=True), \
-             patch("pyqt_app_info.tools.subprocess.run", return_value=mock_proc):
-            result = reg.detect("ExifTool")
-            assert result.status == "available"
-            assert result.path == "/opt/exiftool/exiftool"
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX permission bits")
+    def test_fallback_skips_non_executable(self, monkeypatch, tmp_path):
+        """A non-executable fallback file is passed over without probing it."""
+        plain = tmp_path / "plain"
+        plain.write_text("")
+        plain.chmod(0o644)
+        exe = tmp_path / "exe"
+        exe.write_text("")
+        exe.chmod(0o755)
+        spec = ToolSpec(
+            name="Tool",
+            command="tool",
+            version_flag=None,
+            fallback_paths=[str(plain), str(exe)],
+        )
+        reg = self._make_registry(spec)
 
-    def test_detect_version_error(self):
+        monkeypatch.setattr(_WHICH, _recorder(None))
+        assert reg.detect("Tool").path == str(exe)
+
+    def test_detect_version_error(self, monkeypatch, fake_proc):
         """Tool found but version command returns non-zero."""
         spec = ToolSpec(name="Bad", command="bad")
         reg = self._make_registry(spec)
 
-        mock_proc = MagicMock()
-        mock_proc.returncode = 1
-        mock_proc.stdout = ""
+        monkeypatch.setattr(_WHICH, _recorder("/usr/bin/bad"))
+        monkeypatch.setattr(_POPEN, _recorder(fake_proc(b"", returncode=1)))
 
-        with patch("pyqt_app_info.tools.shutil.which", return_value="/usr/bin/bad"), \
-             patch("pyqt_app_info.tools.subprocess.run", return_value=mock_proc):
-            result = reg.detect("Bad")
-            assert result.status == "error"
-            assert result.path == "/usr/bin/bad"
+        result = reg.detect("Bad")
+        assert result.status == "error"
+        assert result.path == "/usr/bin/bad"
 
-    def test_detect_timeout(self):
+    def test_detect_timeout(self, monkeypatch, fake_proc):
         """Tool found but version command times out."""
-        import subprocess
         spec = ToolSpec(name="Slow", command="slow", version_timeout=0.1)
         reg = self._make_registry(spec)
 
-        with patch("pyqt_app_info.tools.shutil.which", return_value="/usr/bin/slow"), \
-             patch("pyqt_app_info.tools.subprocess.run",
-                   side_effect=subprocess.TimeoutExpired("slow", 0.1)):
-            result = reg.detect("Slow")
-            assert result.status == "error"
-            assert result.path == "/usr/bin/slow"
+        proc = fake_proc(raises=subprocess.TimeoutExpired("slow", 0.1))
+        monkeypatch.setattr(_WHICH, _recorder("/usr/bin/slow"))
+        monkeypatch.setattr(_POPEN, _recorder(proc))
+
+        result = reg.detect("Slow")
+        assert result.status == "error"
+        assert result.path == "/usr/bin/slow"
+        assert proc.timeout == 0.1
+        assert proc.killed
 
-    def test_detect_all(self):
+    def test_detect_spawn_error(self, monkeypatch):
+        """Tool found but the executable can't be started."""
+        spec = ToolSpec(name="Broken", command="broken")
+        reg = self._make_registry(spec)
+
+        def popen(*args, **kwargs):
+            raise PermissionError("denied")
+
+        monkeypatch.setattr(_WHICH, _recorder("/usr/bin/broken"))
+        monkeypatch.setattr(_POPEN, popen)
+
+        result = reg.detect("Broken")
+        assert result.status == "error"
+        assert result.path == "/usr/bin/broken"
+
+    def test_detect_all(self, monkeypatch):
         """detect_all returns results for every registered tool."""
         reg = self._make_registry(
             ToolSpec(name="A", command="a"),
             ToolSpec(name="B", command="b"),
         )
-        with patch("pyqt_app_info.tools.shutil.which", return_value=None):
-            results = reg.detect_all()
-            assert len(results) == 2
-            assert results[0].name == "A"
-            assert results[1].name == "B"
+        monkeypatch.setattr(_WHICH, _recorder(None))
+
+        results = reg.detect_all()
+        assert len(results) == 2
+        assert results[0].name == "A"
+        assert results[1].name == "B"
+
+    def test_invalidate(self, monkeypatch):
+        """invalidate() re-probes only the named tool (or every tool)."""
+        reg = self._make_registry(
+            ToolSpec(name="A", command="a"),
+            ToolSpec(name="B", command="b"),
+        )
+        which = _recorder(None)
+        monkeypatch.setattr(_WHICH, which)
+
+        reg.detect_all()
+        assert len(which.calls) == 2
+
+        reg.invalidate("A")
+        reg.detect_all()
+        assert which.calls[-1][0] == ("a",)
+        assert len(which.calls) == 3
+
+        reg.invalidate()
+        reg.detect_all()
+        assert len(which.calls) == 5
+
+    def test_version_reused_while_executable_unchanged(
+        self, monkeypatch, fake_proc, tmp_path
+    ):
+        """Re-detection skips the subprocess until the binary changes."""
+        exe = tmp_path / "exiftool"
+        exe.write_text("")
+        reg = self._make_registry(ToolSpec(name="ExifTool", command="exiftool"))
+
+        popen = _recorder(fake_proc(b"12.50\n"))
+        monkeypatch.setattr(_WHICH, _recorder(str(exe)))
+        monkeypatch.setattr(_POPEN, popen)
+
+        reg.detect("ExifTool")
+        reg.invalidate()
+        assert reg.detect("ExifTool").version == "12.50"
+        assert len(popen.calls) == 1
+
+        reg.detect("ExifTool", use_cache=False)
+        assert len(popen.calls) == 2
+
+        exe.write_text("upgraded")
+        reg.invalidate()
+        reg.detect("ExifTool")
+        assert len(popen.calls) == 3
+
+    def test_invalidate_unknown_raises(self):
+        with pytest.raises(KeyError):
+            ToolRegistry().invalidate("nope")
+
+    def test_detect_path_only_spec(self, monkeypatch):
+        """version_flag=None resolves the path without spawning a subprocess."""
+        spec = ToolSpec(name="Git", command="git", version_flag=None)
+        reg = self._make_registry(spec)
+
+        popen = _recorder()
+        monkeypatch.setattr(_WHICH, _recorder("/usr/bin/git"))
+        monkeypatch.setattr(_POPEN, popen)
+
+        result = reg.detect("Git")
+        assert result.status == "available"
+        assert result.path == "/usr/bin/git"
+        assert result.version is None
+        assert popen.calls == []
+
+    def test_known_version_skips_probe(self, monkeypatch):
+        """A spec with known_version is located but never run."""
+        spec = ToolSpec(name="ExifTool", command="exiftool", known_version="12.76")
+        reg = self._make_registry(spec)
+
+        popen = _recorder()
+        monkeypatch.setattr(_WHICH, _recorder("/app/bin/exiftool"))
+        monkeypatch.setattr(_POPEN, popen)
+
+        result = reg.detect("ExifTool")
+        assert result.status == "available"
+        assert result.path == "/app/bin/exiftool"
+        assert result.version == "12.76"
+        assert popen.calls == []
+
+    def test_detect_all_skip_version_probe(self, monkeypatch, fake_proc):
+        """probe_version=False skips version commands without caching as full."""
+        spec = ToolSpec(name="ExifTool", command="exiftool", version_flag="-ver")
+        reg = self._make_registry(spec)
+
+        popen = _recorder(fake_proc(b"12.50\n"))
+        monkeypatch.setattr(_WHICH, _recorder("/usr/bin/exiftool"))
+        monkeypatch.setattr(_POPEN, popen)
+
+        [quick] = reg.detect_all(probe_version=False)
+        assert quick.status == "available"
+        assert quick.version is None
+        assert popen.calls == []
+
+        [full] = reg.detect_all()
+        assert full.version == "12.50"
+        assert len(popen.calls) == 1
+
+    def test_detect_all_skips_pool_when_cached(self, monkeypatch):
+        """Fully cached (or single-tool) sweeps run without a thread pool."""
+        reg = self._make_registry(
+            ToolSpec(name="A", command="a"),
+            ToolSpec(name="B", command="b"),
+        )
+        pool = _recorder(wraps=ThreadPoolExecutor)
+        monkeypatch.setattr(_WHICH, _recorder(None))
+        monkeypatch.setattr("pyqt_app_info.tools.ThreadPoolExecutor", pool)
+
+        first = reg.detect_all()
+        assert len(pool.calls) == 1
+        assert reg.detect_all() == first
+        reg.invalidate("A")
+        assert reg.detect_all() == first
+        assert len(pool.calls) == 1
+
+    def test_detect_all_sees_later_registrations(self, monkeypatch):
+        reg = self._make_registry(ToolSpec(name="A", command="a"))
+        monkeypatch.setattr(_WHICH, _recorder(None))
+
+        assert [r.name for r in reg.detect_all()] == ["A"]
+        reg.register(ToolSpec(name="B", command="b"))
+        assert [r.name for r in reg.detect_all()] == ["A", "B"]
+
+    def test_detect_all_empty(self):
+        """detect_all on an empty registry returns an empty list."""
+        assert ToolRegistry().detect_all() == []
+
+    def test_detect_all_max_workers_preserves_order(self, monkeypatch):
+        """Results stay in registration order regardless of concurrency."""
+        names = [f"T{i}" for i in range(10)]
+        reg = self._make_registry(*(ToolSpec(name=n, command=n) for n in names))
+        monkeypatch.setattr(_WHICH, _recorder(None))
+
+        for workers in (1, 3, 16):
+            results = reg.detect_all(max_workers=workers)
+            assert [r.name for r in results] == names
+
+    def test_detect_all_async(self, monkeypatch, fake_proc):
+        """The awaitable sweep matches detect_all and shares its cache."""
+        reg = self._make_registry(
+            ToolSpec(name="ExifTool", command="exiftool", version_flag="-ver"),
+            ToolSpec(name="Missing", command="missing"),
+        )
+
+        def which(command, path=None):
+            return "/usr/bin/exiftool" if command == "exiftool" else None
+
+        popen = _recorder(fake_proc(b"12.50\n"))
+        monkeypatch.setattr(_WHICH, which)
+        monkeypatch.setattr(_POPEN, popen)
+
+        results = asyncio.run(reg.detect_all_async())
+        assert [r.name for r in results] == ["ExifTool", "Missing"]
+        assert results[0].version == "12.50"
+        assert results[1].status == "not_found"
+        assert reg.detect_all() == results
+        assert len(popen.calls) == 1
+
+    def test_detect_result_is_cached(self, monkeypatch, fake_proc):
+        """A second detect() is served from the cache without re-probing."""
+        spec = ToolSpec(name="ExifTool", command="exiftool", version_flag="-ver")
+        reg = self._make_registry(spec)
+
+        popen = _recorder(fake_proc(b"12.50\n"))
+        monkeypatch.setattr(_WHICH, _recorder("/usr/bin/exiftool"))
+        monkeypatch.setattr(_POPEN, popen)
+
+        first = reg.detect("ExifTool")
+        second = reg.detect("ExifTool")
+        assert first is second
+        assert len(popen.calls) == 1
+
+        reg.detect("ExifTool", use_cache=False)
+        assert len(popen.calls) == 2
+
+        ToolRegistry.clear_cache()
+        reg.detect_all()
+        assert len(popen.calls) == 3
+
+    def test_version_cache_follows_file_identity(
+        self, monkeypatch, fake_proc, tmp_path
+    ):
+        """Re-detection reuses the version until the file is replaced."""
+        exe = tmp_path / "exiftool"
+        exe.write_text("")
+        reg = self._make_registry(
+            ToolSpec(name="ExifTool", command="exiftool", version_flag="-ver")
+        )
+        popen = _recorder(fake_proc(b"12.50\n"))
+        monkeypatch.setattr(_WHICH, _recorder(str(exe)))
+        monkeypatch.setattr(_POPEN, popen)
+
+        reg.detect("ExifTool")
+        reg.invalidate()
+        assert reg.detect("ExifTool").version == "12.50"
+        assert len(popen.calls) == 1
+
+        # An upgrade renames a new file over the old one: new inode
+        upgraded = tmp_path / "exiftool.new"
+        upgraded.write_text("")
+        os.replace(upgraded, exe)
+        popen.result = fake_proc(b"13.00\n")
+        reg.invalidate()
+        assert reg.detect("ExifTool").version == "13.00"
+        assert len(popen.calls) == 2
+
+    def test_reregister_replaces_in_place(self, monkeypatch):
+        """Registering a name again swaps its spec without reordering."""
+        reg = self._make_registry(
+            ToolSpec(name="A", command="a"),
+            ToolSpec(name="B", command="b"),
+            ToolSpec(name="A", command="a2"),
+        )
+        which = _recorder(None)
+        monkeypatch.setattr(_WHICH, which)
+
+        assert reg.names == ["A", "B"]
+        assert [r.name for r in reg.detect_all()] == ["A", "B"]
+        assert sorted(args[0] for args, _ in which.calls) == ["a2", "b"]
+
+    def test_registered_names_are_interned(self):
+        name = "".join(["Exif", "Tool"])
+        reg = self._make_registry(ToolSpec(name=name, command="exiftool"))
+        assert reg.names[0] is sys.intern("ExifTool")
+
+    def test_register_str_subclass_name(self, monkeypatch):
+        """str-mixin Enum names register under the member itself."""
+
+        class Tool(str, Enum):
+            EXIF = "ExifTool"
+
+        reg = self._make_registry(ToolSpec(name=Tool.EXIF, command="exiftool"))
+        monkeypatch.setattr(_WHICH, _recorder(None))
+
+        assert reg.names == [Tool.EXIF]
+        assert reg.detect("ExifTool").name == "ExifTool"
 
     def test_detect_unknown_raises(self):
         """Detecting an unregistered name raises KeyError."""
@@ -120,16 +505,324 @@ class TestToolRegistry:
         except KeyError:
             pass
 
-    def test_multiline_version_takes_first_line(self):
+    def test_multiline_version_takes_first_line(self, monkeypatch, fake_proc):
         """Only the first line of version output is captured."""
         spec = ToolSpec(name="Multi", command="multi")
         reg = self._make_registry(spec)
 
-        mock_proc = MagicMock()
-        mock_proc.returncode = 0
-        mock_proc.stdout = "1.2.3\nSome extra info\n"
+        monkeypatch.setattr(_WHICH, _recorder("/usr/bin/multi"))
+        monkeypatch.setattr(_POPEN, _recorder(fake_proc(b"1.2.3\nSome extra info\n")))
+
+        result = reg.detect("Multi")
+        assert result.version == "1.2.3"
+
+    def test_version_output_decoding(self, monkeypatch, fake_proc):
+        """stdin/stderr are nulled; stdout is decoded leniently and CRLF-trimmed."""
+        spec = ToolSpec(name="Win", command="win")
+        reg = self._make_registry(spec)
+
+        popen = _recorder(fake_proc(b"\r\n  v2.0 \xff\r\nmore\r\n"))
+        monkeypatch.setattr(_WHICH, _recorder("/usr/bin/win"))
+        monkeypatch.setattr(_POPEN, popen)
+
+        result = reg.detect("Win")
+        assert result.version == "v2.0 \ufffd"
+        [(_, kwargs)] = popen.calls
+        assert kwargs["stdin"] is subprocess.DEVNULL
+        assert kwargs["stderr"] is subprocess.DEVNULL
+        assert kwargs["stdout"] is subprocess.PIPE
+        assert kwargs["close_fds"] is (sys.platform == "win32")
+
+
+class TestDiskCache:
+    """ToolRegistry(cache_path=...) persistence across registries."""
+
+    def _spec(self) -> ToolSpec:
+        return ToolSpec(name="ExifTool", command="exiftool", version_flag="-ver")
+
+    def _registry(self, cache_path) -> ToolRegistry:
+        reg = ToolRegistry(cache_path=cache_path)
+        reg.register(self._spec())
+        return reg
+
+    @pytest.fixture
+    def primed(self, monkeypatch, fake_proc, tmp_path):
+        """An exiftool whose version 12.50 has been written to the cache.
+
+        Returns ``(exe, cache, popen)``; reassign ``popen.result`` to
+        change what the next probe reports.
+        """
+        exe = tmp_path / "exiftool"
+        exe.write_text("")
+        cache = tmp_path / "cache" / "tools.json"
+        popen = _recorder(fake_proc(b"12.50\n"))
+        monkeypatch.setattr(_WHICH, _recorder(str(exe)))
+        monkeypatch.setattr(_POPEN, popen)
+        assert self._registry(cache).detect("ExifTool").version == "12.50"
+        return exe, cache, popen
+
+    def test_stale_while_revalidate(self, monkeypatch, fake_proc, primed):
+        """A later launch is answered from disk, then refreshed in the background."""
+        _, cache, popen = primed
+        assert json.loads(cache.read_text())["exiftool -ver"]["version"] == "12.50"
+
+        # Simulate a new process: memory cache gone, disk cache remains.
+        # Hold the background refresh back until the disk hit is checked.
+        ToolRegistry.clear_cache()
+        popen.result = fake_proc(b"12.51\n")
+        held = []
+        start_refresh = _DiskCache.revalidate
+        monkeypatch.setattr(
+            _DiskCache, "revalidate", lambda self, refresh: held.append(refresh)
+        )
+        reg = self._registry(cache)
+        assert reg.detect("ExifTool").version == "12.50"
+        assert len(popen.calls) == 1
+        for refresh in held:
+            start_refresh(reg._disk_cache, refresh)
+        reg._disk_cache.join()
+        assert len(popen.calls) == 2
+        assert reg.detect("ExifTool").version == "12.51"
+        assert json.loads(cache.read_text())["exiftool -ver"]["version"] == "12.51"
+
+    def test_early_refresh_is_not_overwritten(self, monkeypatch, fake_proc, primed):
+        """A refresh that lands before the disk hit is stored wins."""
+        _, cache, popen = primed
+
+        # Run the refresh inline so it finishes before detect() stores
+        ToolRegistry.clear_cache()
+        popen.result = fake_proc(b"12.51\n")
+        monkeypatch.setattr(
+            _DiskCache, "revalidate", lambda self, refresh: refresh()
+        )
+        reg = self._registry(cache)
+        reg.detect("ExifTool")
+        assert reg.detect("ExifTool").version == "12.51"
+
+    def test_revalidates_once_per_process(self, fake_proc, primed):
+        """Re-detecting after invalidate() doesn't re-run the version command."""
+        _, cache, popen = primed
+
+        ToolRegistry.clear_cache()
+        popen.result = fake_proc(b"12.51\n")
+        reg = self._registry(cache)
+        reg.detect("ExifTool")
+        reg._disk_cache.join()
+        assert len(popen.calls) == 2
+
+        for _ in range(3):
+            reg.invalidate()
+            assert reg.detect("ExifTool").version == "12.51"
+        reg._disk_cache.join()
+        assert len(popen.calls) == 2
+
+    def test_finished_revalidations_are_released(self, primed):
+        """Finished background refreshes don't accumulate on the registry."""
+        _, cache, _ = primed
+
+        ToolRegistry.clear_cache()
+        reg = self._registry(cache)
+        for _ in range(5):
+            reg.detect("ExifTool")
+            reg.invalidate()
+        reg._disk_cache.join()
+        assert not reg._disk_cache._refreshers
+
+    def test_concurrent_revalidations_are_capped(
+        self, monkeypatch, fake_proc, tmp_path
+    ):
+        """A warm launch refreshes at most _REVALIDATE_WORKERS tools at once."""
+        monkeypatch.setattr("pyqt_app_info.tools._REVALIDATE_WORKERS", 2)
+        names = [f"tool{i}" for i in range(6)]
+        for name in names:
+            (tmp_path / name).write_text("")
+        monkeypatch.setattr(
+            _WHICH, _recorder(wraps=lambda command, path=None: str(tmp_path / command))
+        )
+        monkeypatch.setattr(_POPEN, _recorder(fake_proc(b"1.0\n")))
+        cache = tmp_path / "tools.json"
+
+        def registry():
+            reg = ToolRegistry(cache_path=cache)
+            for name in names:
+                reg.register(ToolSpec(name=name, command=name))
+            return reg
+
+        registry().detect_all()
+
+        lock = threading.Lock()
+        release = threading.Event()
+        running = [0]
+        peak = [0]
+
+        def gated_popen(*args, **kwargs):
+            proc = fake_proc(b"1.1\n")
+
+            def communicate(timeout=None):
+                with lock:
+                    running[0] += 1
+                    peak[0] = max(peak[0], running[0])
+                release.wait(5)
+                with lock:
+                    running[0] -= 1
+                return b"1.1\n", None
+
+            proc.communicate = communicate
+            return proc
+
+        popen = _recorder(wraps=gated_popen)
+        monkeypatch.setattr(_POPEN, popen)
+        ToolRegistry.clear_cache()
+        reg = registry()
+        assert [r.version for r in reg.detect_all()] == ["1.0"] * len(names)
+
+        deadline = time.monotonic() + 5
+        while peak[0] < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        time.sleep(0.05)
+        assert peak[0] == 2
+        release.set()
+        reg._disk_cache.join()
+        assert len(popen.calls) == len(names)
+        assert peak[0] == 2
+
+    def test_changed_executable_is_reprobed(self, fake_proc, primed):
+        """A different mtime makes the disk entry stale — probe synchronously."""
+        exe, cache, popen = primed
+
+        ToolRegistry.clear_cache()
+        os.utime(exe, ns=(0, 1_000_000_000))
+        popen.result = fake_proc(b"13.00\n")
+        assert self._registry(cache).detect("ExifTool").version == "13.00"
+
+    def test_corrupt_cache_file_ignored(self, primed, tmp_path):
+        """An unreadable cache file is treated as empty and overwritten."""
+        corrupt = tmp_path / "corrupt.json"
+        corrupt.write_text("{not json")
+
+        ToolRegistry.clear_cache()
+        assert self._registry(corrupt).detect("ExifTool").version == "12.50"
+        assert "exiftool -ver" in json.loads(corrupt.read_text())
+
+    def test_registries_share_one_cache_per_file(
+        self, monkeypatch, fake_proc, tmp_path
+    ):
+        """Registries on the same file keep each other's entries."""
+        monkeypatch.setattr(_WHICH, _recorder(str(tmp_path / "tool")))
+        monkeypatch.setattr(_POPEN, _recorder(fake_proc(b"1.0\n")))
+        (tmp_path / "tool").write_text("")
+        cache = tmp_path / "tools.json"
+        first = ToolRegistry(cache_path=cache)
+        first.register(ToolSpec(name="A", command="a"))
+        second = ToolRegistry(cache_path=str(cache))
+        second.register(ToolSpec(name="B", command="b"))
+        assert first._disk_cache is second._disk_cache
+
+        first.detect("A")
+        second.detect("B")
+        assert set(json.loads(cache.read_text())) == {"a --version", "b --version"}
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="XDG layout is POSIX-only")
+    def test_default_cache_path_honours_xdg(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        assert default_cache_path() == str(tmp_path / "pyqt-app-info" / "tools.json")
+
+
+class TestWindowsPathIndex:
+    """PATHEXT handling in the PATH index (simulated on any platform)."""
+
+    def test_pathext_order_and_case(self, monkeypatch, tmp_path):
+        bin_dir = tmp_path / "bin"
+        bin_dir.mkdir()
+        for name in ("Tool.bat", "tool.EXE", "readme.txt"):
+            (bin_dir / name).write_text("")
+        monkeypatch.setattr(sys, "platform", "win32")
+        monkeypatch.setenv("PATHEXT", ".COM;.EXE;.BAT;.CMD")
+
+        index = _path_index(str(bin_dir))
+        assert index["tool"] == str(bin_dir / "tool.EXE")
+        assert index["tool.bat"] == str(bin_dir / "Tool.bat")
+        assert "readme" not in index
+        assert "readme.txt" not in index
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX permission bits")
+class TestPathIndex:
+    """PATH lookups served from the scanned directory index."""
+
+    def _make_exe(self, directory, name, mode=0o755):
+        directory.mkdir(exist_ok=True)
+        exe = directory / name
+        exe.write_text("")
+        exe.chmod(mode)
+        return exe
+
+    def test_index_hit_skips_shutil_which(self, monkeypatch, tmp_path):
+        first = self._make_exe(tmp_path / "first", "tool")
+        self._make_exe(tmp_path / "second", "tool")
+        monkeypatch.setenv(
+            "PATH", os.pathsep.join([str(tmp_path / "first"), str(tmp_path / "second")])
+        )
+        which = _recorder()
+        monkeypatch.setattr(_WHICH, which)
+
+        assert _which("tool") == str(first)
+        assert which.calls == []
+
+    def test_non_executable_hit_falls_back(self, monkeypatch, tmp_path):
+        self._make_exe(tmp_path / "bin", "tool", mode=0o644)
+        monkeypatch.setenv("PATH", str(tmp_path / "bin"))
+        which = _recorder(None)
+        monkeypatch.setattr(_WHICH, which)
+
+        assert _which("tool") is None
+        assert which.calls == [(("tool",), {"path": str(tmp_path / "bin")})]
+
+    def test_misses_are_memoized_per_path(self, monkeypatch, tmp_path):
+        """A command missing from PATH is only searched for once."""
+        which = _recorder(None)
+        monkeypatch.setattr(_WHICH, which)
+
+        assert _which("absent") is None
+        assert _which("absent") is None
+        assert len(which.calls) == 1
+        monkeypatch.setenv("PATH", str(tmp_path))
+        assert _which("absent") is None
+        assert len(which.calls) == 2
+
+    def test_index_follows_path_changes(self, monkeypatch, tmp_path):
+        exe = self._make_exe(tmp_path / "bin", "tool")
+        monkeypatch.setattr(_WHICH, _recorder(None))
+
+        assert _which("tool") is None
+        monkeypatch.setenv("PATH", str(tmp_path / "bin"))
+        assert _which("tool") == str(exe)
+
+    def test_invalidate_rescans_path(self, monkeypatch, tmp_path):
+        """A tool installed earlier in PATH is picked up after invalidate()."""
+        late = self._make_exe(tmp_path / "late", "tool")
+        (tmp_path / "early").mkdir()
+        monkeypatch.setenv(
+            "PATH", os.pathsep.join([str(tmp_path / "early"), str(tmp_path / "late")])
+        )
+        monkeypatch.setattr(_WHICH, _recorder(None))
+        reg = ToolRegistry()
+        reg.register(ToolSpec(name="Tool", command="tool", version_flag=None))
+        assert reg.detect("Tool").path == str(late)
+
+        early = self._make_exe(tmp_path / "early", "tool")
+        reg.invalidate("Tool")
+        assert reg.detect("Tool").path == str(early)
+
+    def test_use_cache_false_rescans_path(self, monkeypatch, tmp_path):
+        """detect(use_cache=False) finds a tool installed after a miss."""
+        (tmp_path / "bin").mkdir()
+        monkeypatch.setenv("PATH", str(tmp_path / "bin"))
+        reg = ToolRegistry()
+        reg.register(ToolSpec(name="Tool", command="tool", version_flag=None))
+        assert reg.detect("Tool").status == "not_found"
 
-        with patch("pyqt_app_info.tools.shutil.which", return_value="/usr/bin/multi"), \
-             patch("pyqt_app_info.tools.subprocess.run", return_value=mock_proc):
-            result = reg.detect("Multi")
-            assert result.version == "1.2.3"
+        exe = self._make_exe(tmp_path / "bin", "tool")
+        assert reg.detect("Tool").status == "not_found"
+        assert reg.detect("Tool", use_cache=False).path == str(exe)
+        assert reg.detect_all(use_cache=False)[0].path == str(exe)